@@ -3,7 +3,11 @@ CLI University Application
 Command-line interface for the university enrollment system.
 """
 
-from typing import List, Optional
+import atexit
+import hmac
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
 from models.student import Student
 from models.subject import Subject
 from models.admin import Admin
@@ -14,6 +18,29 @@ from models.enum.roles import UserRole
 from repository.data_manager import DataManager
 
 
+_INTERACTIVE = sys.stdin.isatty() or sys.stdout.isatty()
+
+
+def _enable_ansi_colors():
+    """Turn on ANSI escape handling in the Windows console; POSIX terminals need nothing"""
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # ENABLE_PROCESSED_OUTPUT | ENABLE_WRAP_AT_EOL_OUTPUT | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+
+
+def _prompt(message: str) -> str:
+    """Read one line of input; skip the per-prompt flush for piped/scripted runs"""
+    if _INTERACTIVE:
+        return input(message)
+    sys.stdout.write(message)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
 class CLIUniApp:
     """Command-line interface for the university enrollment system."""
     class Color:
@@ -23,22 +50,83 @@ class CLIUniApp:
         YELLOW = "\033[93m"
         RED = "\033[91m"
 
+    # Indentation for first- and second-level menu output
+    _INDENT_LVL1 = "      "
+    _INDENT_LVL2 = _INDENT_LVL1 * 2
+
+    # Static menu prompts, colored once at import time
+    _PROMPT_MAIN = f"{Color.CYAN}University System: (A)dmin, (S)tudent, or X : {Color.RESET}"
+    _PROMPT_STUDENT = f"{Color.CYAN}      Student System (l/r/x): {Color.RESET}"
+    _PROMPT_COURSE = f"{Color.CYAN}            Student Course Menu (c/e/r/s/x): {Color.RESET}"
+    _PROMPT_ADMIN = f"{Color.CYAN}      Admin System (c/g/p/r/s/x): {Color.RESET}"
+    _MSG_THANK_YOU = f"{Color.YELLOW}Thank You{Color.RESET}"
+
+    # Static section banners
+    _BANNER_SIGN_IN = f"{Color.GREEN}Student Sign In{Color.RESET}"
+    _BANNER_SIGN_UP = f"{Color.GREEN}Student Sign Up{Color.RESET}"
+    _BANNER_UPDATE_PASSWORD = f"{Color.YELLOW}Updating Password{Color.RESET}"
+    _BANNER_STUDENT_LIST = f"{Color.YELLOW}Student List{Color.RESET}"
+    _BANNER_GRADE_GROUPING = f"{Color.YELLOW}Grade Grouping{Color.RESET}"
+    _BANNER_PASS_FAIL = f"{Color.YELLOW}PASS/FAIL Partition{Color.RESET}"
+    _BANNER_CLEARING = f"{Color.YELLOW}Clearing students database{Color.RESET}"
+
+    _MAX_CONFIRM_ATTEMPTS = 3
+    _GRADE_ORDER = ('P', 'C', 'D', 'HD', 'Z')
+
     @staticmethod
     def _c(text: str, color: str) -> str:
         return f"{color}{text}{CLIUniApp.Color.RESET}"
     
     def __init__(self):
+        _enable_ansi_colors()
         self.session_manager = SessionManager()
         self.data_manager = DataManager()
         self.validation_service = ValidationService()
-        self.students: List[Student] = []
-        self.subjects: List[Subject] = []
+        self._students: Optional[List[Student]] = None
+        self._by_id: Dict[str, Student] = {}
+        self._by_email: Dict[str, Student] = {}
+        self._subjects_by_id: Dict[str, Subject] = {}
         
         # Initialize with some sample subjects
         self._initialize_subjects()
         
-        # Load existing students
-        self.students = self.data_manager.load_data()
+        # Existing students are loaded from disk on first access
+        
+        # Formatted admin report rows; reset whenever student data changes
+        self._report_cache: Optional[Tuple[List[str], Dict[str, List[str]], Dict[str, List[str]]]] = None
+        
+        # Staged changes are written once on menu exit or interpreter shutdown
+        atexit.register(self._flush)
+        
+        # Menu dispatch tables; "x" (exit) is handled by each loop
+        self._main_actions = {"A": self._admin_system, "S": self._student_system}
+        self._student_actions = {"l": self._student_login, "r": self._student_registration}
+        self._course_actions = {
+            "c": self._change_password,
+            "e": self._enroll_subject,
+            "r": self._remove_subject,
+            "s": self._view_enrollments,
+        }
+        self._admin_actions = {
+            "c": self._clear_all_data,
+            "g": self._view_students_by_grade,
+            "p": self._categorize_students,
+            "r": self._remove_student,
+            "s": self._view_all_students,
+        }
+    
+    @property
+    def students(self) -> List[Student]:
+        """Registered students, loaded lazily from the data file"""
+        self._ensure_loaded()
+        return self._students
+    
+    def _ensure_loaded(self):
+        """Load existing students and index them for O(1) lookups"""
+        if self._students is None:
+            self._students = self.data_manager.load_data()
+            self._by_id = {s.student_id: s for s in self._students}
+            self._by_email = {s.email: s for s in self._students}
     
     def _initialize_subjects(self):
         """Initialize with sample subjects"""
@@ -56,45 +144,75 @@ class CLIUniApp:
         ]
         
         for subject_id, name in sample_subjects:
+            subject_id = sys.intern(subject_id)
             subject = Subject(subject_id, name, f"Description for {name}")
-            self.subjects.append(subject)
+            self._subjects_by_id[subject_id] = subject
+    
+    def _stage(self, student: Student):
+        """Stage a changed student for the next flush and drop stale reports"""
+        self.data_manager.stage_student(student)
+        self._report_cache = None
+    
+    def _flush(self) -> bool:
+        """Write staged student changes, if any"""
+        if self._students is None:
+            return True
+        return self.data_manager.flush_pending(self._students)
+    
+    def _add_student(self, student: Student):
+        """Append a student and keep the lookup indexes in sync"""
+        self.students.append(student)
+        self._report_cache = None
+        self._by_id[student.student_id] = student
+        self._by_email[student.email] = student
+    
+    def _remove_student_local(self, student_id: str) -> Optional[Student]:
+        """Drop a student from the lookup indexes"""
+        self._report_cache = None
+        student = self._by_id.pop(student_id, None)
+        if student:
+            self._by_email.pop(student.email, None)
+        return student
     
     def _get_current_student(self) -> Optional[Student]:
         """Get current student from session"""
         session = self.session_manager.get_current_session()
-        if session and session.user_role == UserRole.STUDENT:
-            # Find student by ID
-            for student in self.students:
-                if student.student_id == session.user_id:
-                    return student
+        if session and session.user_role is UserRole.STUDENT:
+            return session.user_obj
         return None
     
-    def _get_current_admin(self) -> Optional[Admin]:
-        """Get current admin from session"""
-        session = self.session_manager.get_current_session()
-        if session and session.user_role == UserRole.ADMIN:
-            admin_info = Admin.PREDEFINED_ADMINS.get(session.user_id)
-            if admin_info:
-                return Admin(session.user_id, admin_info["name"], admin_info["department"])
-        return None
+    @staticmethod
+    def _menu_choice(prompt: str, upper: bool = False) -> str:
+        """Read a menu key, normalized to the menu's letter case"""
+        raw = _prompt(prompt)
+        # Single keystrokes need no stripping
+        if len(raw) != 1:
+            raw = raw.strip()
+        return raw.upper() if upper else raw.lower()
     
-    def run(self):
-        """Main application loop"""
-        
-        while True:
-            # One-line, colored prompt like sample I/O
-            prompt = self._c("University System: (A)dmin, (S)tudent, or X : ", self.Color.CYAN)
-            choice = input(prompt).strip().upper()
+    def _menu_loop(self, prompt: str, actions: Dict[str, Callable[[], Optional[bool]]],
+                   upper: bool = False, active: Optional[Callable[[], bool]] = None) -> bool:
+        """Run a table-driven menu; returns True when the user chose exit"""
+        exit_key = "X" if upper else "x"
+        while active is None or active():
+            choice = self._menu_choice(prompt, upper)
             
-            if choice == "A":
-                self._admin_system()
-            elif choice == "S":
-                self._student_system()
-            elif choice == "X":
-                print(self._c("Thank You", self.Color.YELLOW))
-                break
+            action = actions.get(choice)
+            if action:
+                # An action returning True ends the menu (e.g. a completed login)
+                if action():
+                    return False
+            elif choice == exit_key:
+                return True
             else:
                 print("Invalid choice. Please try again.")
+        return False
+    
+    def run(self):
+        """Main application loop"""
+        self._menu_loop(self._PROMPT_MAIN, self._main_actions, upper=True)
+        self._flush()
+        print(self._MSG_THANK_YOU)
     
     def _admin_system(self):
         """Admin system - direct access without login"""
@@ -102,42 +220,28 @@ class CLIUniApp:
     
     def _student_system(self):
         """Student system with login/register options"""
+        self._menu_loop(self._PROMPT_STUDENT, self._student_actions)
+    
+    def _read_credentials(self, indent: str) -> Tuple[str, str]:
+        """Prompt for email and password, looping until both formats are acceptable"""
         while True:
-            # Colored one-line student menu
-            prompt = self._c("      Student System (l/r/x): ", self.Color.CYAN)
-            choice = input(prompt).strip().lower()
-            
-            if choice == "l":
-                login_success = self._student_login()
-                if login_success:
-                    break
-                else:
-                    continue
-            elif choice == "r":
-                self._student_registration()
-            elif choice == "x":
-                break
-            else:
-                print("Invalid choice. Please try again.")
+            email = _prompt(indent + "Email: ").strip()
+            password = _prompt(indent + "Password: ").strip()
+            if self.validation_service.validate_credentials(email, password):
+                print(indent + self._c("email and password formats acceptable", self.Color.YELLOW))
+                return email, password
+            print(indent + self._c("Incorrect email or password format", self.Color.RED))
     
     def _student_login(self):
         """Handle student login"""
-        indent = "      "
-        print(indent + self._c("Student Sign In", self.Color.GREEN))
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_SIGN_IN)
         
-        # Loop until valid formats
-        while True:
-            email = input(indent + "Email: ").strip()
-            password = input(indent + "Password: ").strip()
-            if not (self.validation_service.validate_email(email) and self.validation_service.validate_password(password)):
-                print(indent + self._c("Incorrect email or password format", self.Color.RED))
-                continue
-            else:
-                print(indent + self._c("email and password formats acceptable", self.Color.YELLOW))
-                break
+        email, password = self._read_credentials(indent)
         
-        # Authenticate student using session manager
-        if self.session_manager.login_student(email, password, self.students):
+        # Resolve the account through the email index; only that student's hash is checked
+        self._ensure_loaded()
+        if self.session_manager.login_student(email, password, self._by_email):
             self._subject_enrolment_system()
             return True
         else:
@@ -146,72 +250,51 @@ class CLIUniApp:
     
     def _student_registration(self):
         """Handle student registration"""
-        indent = "      "
-        print(indent + self._c("Student Sign Up", self.Color.GREEN))
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_SIGN_UP)
         
-        # Ask for email and password, loop until formats are acceptable
-        while True:
-            email = input(indent + "Email: ").strip()
-            password = input(indent + "Password: ").strip()
-            if not (self.validation_service.validate_email(email) and self.validation_service.validate_password(password)):
-                print(indent + self._c("Incorrect email or password format", self.Color.RED))
-                continue
-            else:
-                print(indent + self._c("email and password formats acceptable", self.Color.YELLOW))
-                break
+        email, password = self._read_credentials(indent)
         
         # Check existing email
-        existing = next((s for s in self.students if s.email == email), None)
+        self._ensure_loaded()
+        existing = self._by_email.get(email)
         if existing:
             print(indent + self._c(f"Student {existing.name} already exists", self.Color.RED))
             return
         
         # Ask for name after formats are accepted
-        name = input(indent + "Name: ").strip()
+        name = _prompt(indent + "Name: ").strip()
         print(indent + self._c(f"Enrolling Student {name}", self.Color.YELLOW))
         
         # Final centralized validation for completeness
-        validation_result = self.validation_service.validate_student_registration(name, email, password, self.students)
+        validation_result = self.validation_service.validate_student_registration(name, email, password, self._by_email)
         if not validation_result['valid']:
             print(self._c(validation_result['error'], self.Color.RED))
             return
         
         # Generate unique student ID
-        existing_ids = [s.student_id for s in self.students]
-        student_id = self.validation_service.generate_student_id(existing_ids)
+        student_id = self.validation_service.generate_student_id(self._by_id.keys())
         
         # Create new student with hashed password
         new_student = Student.create_student(student_id, name, email, password)
-        self.students.append(new_student)
         
-        # Save to file
-        if self.data_manager.save_data(self.students):
-            pass  # Registration successful - no message displayed
+        # Save first and only register the student in memory once it is on disk
+        if self.data_manager.save_changes(self.students + [new_student]):
+            self._add_student(new_student)
         else:
             print("Registration failed. Please try again.")
-            self.students.remove(new_student)
     
     def _subject_enrolment_system(self):
         """Subject Enrolment System operations menu"""
-        while self.session_manager.is_logged_in() and self.session_manager.get_current_user_role() == UserRole.STUDENT:
-            indent = "            "
-            prompt = self._c(indent + "Student Course Menu (c/e/r/s/x): ", self.Color.CYAN)
-            choice = input(prompt).strip().lower()
-            
-            if choice == "c":
-                self._change_password()
-            elif choice == "e":
-                self._enroll_subject()
-            elif choice == "r":
-                self._remove_subject()
-            elif choice == "s":
-                self._view_enrollments()
-            elif choice == "x":
-                self.session_manager.logout()
-                print("Logged out successfully.")
-                break
-            else:
-                print("Invalid choice. Please try again.")
+        if self._menu_loop(self._PROMPT_COURSE, self._course_actions, active=self._student_session_active):
+            self._flush()
+            self.session_manager.logout()
+            print("Logged out successfully.")
+    
+    def _student_session_active(self) -> bool:
+        """Check that a student is still logged in"""
+        session = self.session_manager.get_current_session()
+        return session is not None and session.user_role is UserRole.STUDENT
     
     def _enroll_subject(self):
         """Enroll in a random subject"""
@@ -222,16 +305,23 @@ class CLIUniApp:
             return
         
         # Check enrollment limit
-        indent = "            "
+        indent = self._INDENT_LVL2
         if len(current_student.enrollments) >= 4:
             print(indent + self._c("Students are allowed to enrol in 4 subjects only", self.Color.RED))
             return
         
+        # Bail out before picking when every subject is already taken
+        enrolled = current_student.enrollments
+        available = [s for sid, s in self._subjects_by_id.items() if sid not in enrolled]
+        if not available:
+            print(indent + "No subjects available for enrollment. You may already be enrolled in all available subjects.")
+            return
+        
         # Enroll in a random subject
-        enrolled_subject = current_student.enroll_random(self.subjects)
+        enrolled_subject = current_student.enroll_random(available)
         
         if enrolled_subject:
-            self.data_manager.save_data(self.students)
+            self._stage(current_student)
             print(indent + self._c(f"Enrolling in Subject-{enrolled_subject.subject_id}", self.Color.YELLOW))
             print(indent + self._c(f"You are now enrolled in {len(current_student.enrollments)} out of 4 subjects", self.Color.YELLOW))
         else:
@@ -244,14 +334,14 @@ class CLIUniApp:
             print("Session expired. Please log in again.")
             return
         
-        indent = "            "
+        indent = self._INDENT_LVL2
         # Prompt for subject id directly, matching sample I/O style
-        subject_id = input(indent + "Remove Subject by ID: ").strip()
+        subject_id = _prompt(indent + "Remove Subject by ID: ").strip()
         if not subject_id:
             return
         
         if current_student.remove_subject(subject_id):
-            self.data_manager.save_data(self.students)
+            self._stage(current_student)
             print(indent + self._c(f"Dropping Subject-{subject_id}", self.Color.YELLOW))
             print(indent + self._c(f"You are now enrolled in {len(current_student.enrollments)} out of 4 subjects", self.Color.YELLOW))
         else:
@@ -264,17 +354,18 @@ class CLIUniApp:
             print("Session expired. Please log in again.")
             return
             
-        enrollments = current_student.view_enrollments()
+        # Read the enrollments directly; view_enrollments() would build dicts and format dates we don't show
+        enrollments = current_student.enrollments
         
-        indent = "            "
+        indent = self._INDENT_LVL2
         print(indent + self._c(f"Showing {len(enrollments)} subjects", self.Color.YELLOW))
-        for enrollment in enrollments:
-            subject_id = enrollment['subject_id']
-            mark = enrollment['mark']
-            grade = enrollment['grade']
-            # Normalize grade width so closing brackets align (e.g., 'P' vs 'HD')
-            grade_display = str(grade).rjust(2)
-            print(indent + f"[ Subject::{subject_id} -- mark = {mark} -- grade =  {grade_display} ]")
+        if not enrollments:
+            return
+        # Normalize grade width so closing brackets align (e.g., 'P' vs 'HD')
+        sys.stdout.write("\n".join(
+            f"{indent}[ Subject::{e.subject_id} -- mark = {e.mark} -- grade =  {e.grade:>2} ]"
+            for e in enrollments.values()
+        ) + "\n")
     
     def _change_password(self):
         """Change student password"""
@@ -283,111 +374,108 @@ class CLIUniApp:
             print("Session expired. Please log in again.")
             return
         
-        indent = "            "
-        print(indent + self._c("Updating Password", self.Color.YELLOW))
+        indent = self._INDENT_LVL2
+        print(indent + self._BANNER_UPDATE_PASSWORD)
         
-        new_password = input(indent + "New Password: ").strip()
-        confirm_password = input(indent + "Confirm Password: ").strip()
-        while confirm_password != new_password:
-            print(indent + self._c("Password does not match – try again", self.Color.RED))
-            confirm_password = input(indent + "Confirm Password: ").strip()
+        new_password = _prompt(indent + "New Password: ").strip()
+        confirm_password = _prompt(indent + "Confirm Password: ").strip()
         
-        # Validate new password format
+        # Validate new password format before asking for the confirmation again
         if not self.validation_service.validate_password(new_password):
             print(indent + self._c("Incorrect password format", self.Color.RED))
             return
         
+        attempts = 1
+        while not hmac.compare_digest(new_password.encode(), confirm_password.encode()):
+            if attempts >= self._MAX_CONFIRM_ATTEMPTS:
+                print(indent + self._c("Too many mismatches – password unchanged", self.Color.RED))
+                return
+            attempts += 1
+            print(indent + self._c("Password does not match – try again", self.Color.RED))
+            confirm_password = _prompt(indent + "Confirm Password: ").strip()
+        
         # Apply change directly without asking for the old password
         current_student.password_hash = AuthenticationService.hash_password(new_password)
-        self.data_manager.save_data(self.students)
+        self._stage(current_student)
     
     def _admin_menu(self):
         """Admin operations menu"""
-        while True:
-            choice = input(self._c("      Admin System (c/g/p/r/s/x): ", self.Color.CYAN)).strip().lower()
-            
-            if choice == "c":
-                self._clear_all_data()
-            elif choice == "g":
-                self._view_students_by_grade()
-            elif choice == "p":
-                self._categorize_students()
-            elif choice == "r":
-                self._remove_student()
-            elif choice == "s":
-                self._view_all_students()
-            elif choice == "x":
-                break
-            else:
-                print("Invalid choice. Please try again.")
+        self._menu_loop(self._PROMPT_ADMIN, self._admin_actions)
+        self._flush()
+    
+    def _get_report(self) -> Tuple[List[str], Dict[str, List[str]], Dict[str, List[str]]]:
+        """Build the admin report rows in one pass over students, cached until data changes"""
+        if self._report_cache is None:
+            indent = self._INDENT_LVL1
+            student_lines: List[str] = []
+            grade_groups: Dict[str, List[str]] = defaultdict(list)
+            pass_fail: Dict[str, List[str]] = {'PASS': [], 'FAIL': []}
+            for student in self.students:
+                student_lines.append(f"{indent}{student.name} ::  {student.student_id} --> Email: {student.email}")
+                for enrollment in student.enrollments.values():
+                    entry = f"{student.name} ::  {student.student_id} --> GRADE:  {enrollment.grade} - MARK:  {enrollment.mark:.2f}"
+                    grade_groups[enrollment.grade].append(entry)
+                    pass_fail['PASS' if enrollment.mark >= 50 else 'FAIL'].append(entry)
+            self._report_cache = (student_lines, grade_groups, pass_fail)
+        return self._report_cache
     
     def _view_all_students(self):
         """View all registered students"""
-        indent = "      "
-        print(indent + self._c("Student List", self.Color.YELLOW))
-        if not self.students:
-            print(indent + "      " + "< Nothing to Display >")
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_STUDENT_LIST)
+        student_lines, _, _ = self._get_report()
+        if not student_lines:
+            print(self._INDENT_LVL2 + "< Nothing to Display >")
             return
-        for s in self.students:
-            print(indent + f"{s.name} ::  {s.student_id} --> Email: {s.email}")
+        sys.stdout.write("\n".join(student_lines) + "\n")
     
     def _view_students_by_grade(self):
         """View students organized by grade"""
-        admin = Admin("admin", "System Admin", "IT Department")
-        grade_groups = admin.view_by_grade(self.students)
-        indent = "      "
-        print(indent + self._c("Grade Grouping", self.Color.YELLOW))
-        all_empty = True
-        for grade_key in ['P','C','D','HD','Z']:
-            students = grade_groups.get(grade_key, [])
-            if students:
-                all_empty = False
-                parts = []
-                for st in students:
-                    parts.append(f"{st['name']} ::  {st['student_id']} --> GRADE:  {grade_key} - MARK:  {float(st['mark']):.2f}")
-                print(indent + f"{grade_key}  --> [" + ", ".join(parts) + "]")
-        if all_empty:
-            print(indent + "      " + "< Nothing to Display >")
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_GRADE_GROUPING)
+        _, grade_groups, _ = self._get_report()
+        lines = []
+        for grade_key in self._GRADE_ORDER:
+            parts = grade_groups.get(grade_key)
+            if parts:
+                lines.append(indent + f"{grade_key}  --> [" + ", ".join(parts) + "]")
+        if not lines:
+            print(self._INDENT_LVL2 + "< Nothing to Display >")
+            return
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _categorize_students(self):
         """Categorize students into PASS/FAIL"""
-        admin = Admin("admin", "System Admin", "IT Department")
-        categories = admin.categorize_pass_fail(self.students)
-        indent = "      "
-        print(indent + self._c("PASS/FAIL Partition", self.Color.YELLOW))
-        def fmt(listing):
-            if not listing:
-                return ""
-            parts = []
-            for st in listing:
-                parts.append(f"{st['name']} ::  {st['student_id']} --> GRADE:  {st.get('grade','')} - MARK:  {float(st['mark']):.2f}")
-            return ", ".join(parts)
-        fail_list = categories.get("FAIL", [])
-        pass_list = categories.get("PASS", [])
-        print(indent + f"FAIL --> [{fmt(fail_list)}]")
-        print(indent + f"PASS --> [{fmt(pass_list)}]")
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_PASS_FAIL)
+        _, _, pass_fail = self._get_report()
+        sys.stdout.write(
+            f"{indent}FAIL --> [{', '.join(pass_fail['FAIL'])}]\n"
+            f"{indent}PASS --> [{', '.join(pass_fail['PASS'])}]\n"
+        )
     
     def _remove_student(self):
         """Remove individual student"""
-        # Create a temporary admin instance for operations
-        admin = Admin("admin", "System Admin", "IT Department")
-        indent = "      "
-        student_id = input(indent + "Remove by ID: ").strip()
+        indent = self._INDENT_LVL1
+        student_id = _prompt(indent + "Remove by ID: ").strip()
         
-        if admin.remove_student(student_id, self.students):
-            self.data_manager.save_data(self.students)
+        if Admin.remove_student(student_id, self.students):
+            self._remove_student_local(student_id)
+            self.data_manager.forget_student(student_id)
             print(indent + self._c(f"Removing Student {student_id} Account", self.Color.YELLOW))
         else:
             print(indent + self._c(f"Student {student_id} does not exist", self.Color.RED))
     
     def _clear_all_data(self):
         """Clear entire students.data file"""
-        admin = Admin("admin", "System Admin", "IT Department")
-        indent = "      "
-        print(indent + self._c("Clearing students database", self.Color.YELLOW))
-        confirm = input(indent + self._c("Are you sure you want to clear the database (Y)ES/(N)O: ", self.Color.RED)).strip().lower()
+        indent = self._INDENT_LVL1
+        print(indent + self._BANNER_CLEARING)
+        confirm = _prompt(indent + self._c("Are you sure you want to clear the database (Y)ES/(N)O: ", self.Color.RED)).strip().lower()
         if confirm == "y" or confirm == "yes":
-            if admin.clear_all(self.students):
+            if Admin.clear_all(self.students):
+                self._by_id.clear()
+                self._by_email.clear()
+                self._report_cache = None
                 self.data_manager.clear_data()
                 print(indent + self._c("Students data cleared", self.Color.YELLOW))
             else:
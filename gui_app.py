@@ -4,8 +4,9 @@ Graphical user interface for the university enrollment system.
 """
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from models.student import Student
 from models.subject import Subject
 from models.validation import ValidationService
@@ -13,67 +14,127 @@ from models.session_manager import SessionManager
 from repository.data_manager import DataManager
 
 
+# Sample subject catalogue, built once at import and shared by every GUIUniApp
+_SAMPLE_SUBJECTS = tuple(
+    Subject(subject_id, name, f"Description for {name}")
+    for subject_id, name in (
+        ("101", "Introduction to Programming"),
+        ("102", "Data Structures"),
+        ("201", "Software Engineering"),
+        ("301", "Database Systems"),
+        ("401", "Machine Learning"),
+        ("111", "Calculus I"),
+        ("112", "Calculus II"),
+        ("121", "Physics I"),
+        ("131", "Chemistry I"),
+        ("141", "English Composition")
+    )
+)
+
+
 class GUIUniApp:
     """Graphical user interface for the university enrollment system."""
     
+    # Changes made within this window are coalesced into a single write
+    _SAVE_DELAY_MS = 100
+    # How long a success message stays in the status bar
+    _STATUS_CLEAR_MS = 3000
+    # How often the Tk loop checks whether a background login has finished
+    _LOGIN_POLL_MS = 20
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("GUI University Enrollment System")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.session_manager = SessionManager()
         self.current_user: Optional[Student] = None
         self.data_manager = DataManager()
         self.validation_service = ValidationService()
         self.students: List[Student] = []
-        self.subjects: List[Subject] = []
+        self._students_loaded = False
+        self._students_by_email: Dict[str, Student] = {}
+        self._save_after_id: Optional[str] = None
+        self._status_after_id: Optional[str] = None
+        # A single worker keeps file writes off the Tk thread and in submission order
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        # Password hashing runs here so the window keeps redrawing while a login is checked
+        self._login_executor = ThreadPoolExecutor(max_workers=1)
+        self._login_future: Optional[Future] = None
+        self.subjects: Tuple[Subject, ...] = ()
+        self._subjects_by_id: Dict[str, Subject] = {}
         
         # Initialize with sample subjects
         self._initialize_subjects()
         
-        # Load existing students
-        self.students = self.data_manager.load_data()
+        # Existing students are loaded on the first login attempt so the window shows sooner
+        
+        # Both windows are built on first use and then toggled with grid()/grid_remove()
+        self._login_frame: Optional[ttk.Frame] = None
+        self._enrollment_frame: Optional[ttk.Frame] = None
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
         
         # Start with login window
         self._create_login_window()
     
     def _initialize_subjects(self):
         """Initialize with sample subjects"""
-        sample_subjects = [
-            ("101", "Introduction to Programming"),
-            ("102", "Data Structures"),
-            ("201", "Software Engineering"),
-            ("301", "Database Systems"),
-            ("401", "Machine Learning"),
-            ("111", "Calculus I"),
-            ("112", "Calculus II"),
-            ("121", "Physics I"),
-            ("131", "Chemistry I"),
-            ("141", "English Composition")
-        ]
-        
-        for subject_id, name in sample_subjects:
-            subject = Subject(subject_id, name, f"Description for {name}")
-            self.subjects.append(subject)
+        # The catalogue is never mutated, so the shared tuple is used as-is
+        self.subjects = _SAMPLE_SUBJECTS
+        self._subjects_by_id = {subject.subject_id: subject for subject in _SAMPLE_SUBJECTS}
     
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
     
+    def _schedule_save(self, student: Student):
+        """Stage a changed student and (re)start the timer for the coalesced write"""
+        self.data_manager.stage_student(student)
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self._SAVE_DELAY_MS, self._flush_save)
+    
+    def _flush_save(self):
+        """Write staged student changes, if any"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        # Build the payload here, where the models live; the worker only writes bytes
+        payload = self.data_manager.take_pending(self.students)
+        if payload is not None:
+            self._save_executor.submit(self.data_manager.write_payload, payload)
+    
+    def _on_close(self):
+        """Flush pending changes and wait for the writes before closing the window"""
+        self._flush_save()
+        self._save_executor.shutdown(wait=True)
+        self._login_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def _create_login_window(self):
-        """Create the login window"""
-        # Clear existing widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        """Show the login window, building it on first use"""
+        if self._enrollment_frame is not None:
+            self._enrollment_frame.grid_remove()
+        if self._login_frame is None:
+            self._build_login_frame()
+        else:
+            # Start each login with an empty form, as a freshly built window would
+            self.email_entry.delete(0, tk.END)
+            self.password_entry.delete(0, tk.END)
+        self._login_frame.grid()
+        self.email_entry.focus_set()
+    
+    def _build_login_frame(self):
+        """Build the login widgets once; later logins only show and hide the frame"""
         # Main frame
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._login_frame = main_frame
         
         # Configure grid weights
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         
         # Title
@@ -90,6 +151,10 @@ class GUIUniApp:
         self.password_entry = ttk.Entry(main_frame, width=30, show="*")
         self.password_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         
+        # Enter submits from either field
+        self.email_entry.bind('<Return>', lambda event: self._handle_login())
+        self.password_entry.bind('<Return>', lambda event: self._handle_login())
+        
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.grid(row=3, column=0, columnspan=2, pady=20)
@@ -107,36 +172,81 @@ class GUIUniApp:
         email = self.email_entry.get().strip()
         password = self.password_entry.get().strip()
         
+        if self._login_future is not None:
+            return
+        
         if not email or not password:
             messagebox.showerror("Error", "Please enter both email and password!")
             return
         
-        # Authenticate student using session manager
-        if self.session_manager.login_student(email, password, self.students):
+        if not self._students_loaded:
+            self.students = self.data_manager.load_data()
+            # The GUI never adds students, so the index is built once
+            self._students_by_email = {s.email: s for s in self.students}
+            self._students_loaded = True
+        
+        # Authenticate student using session manager; only the indexed candidate's hash is checked
+        self._login_future = self._login_executor.submit(
+            self.session_manager.login_student, email, password, self._students_by_email)
+        self.root.after(self._LOGIN_POLL_MS, self._finish_login)
+    
+    def _finish_login(self):
+        """Open the enrollment window once the background login check has finished"""
+        if not self._login_future.done():
+            self.root.after(self._LOGIN_POLL_MS, self._finish_login)
+            return
+        future, self._login_future = self._login_future, None
+        try:
+            logged_in = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Login failed: {e}")
+            return
+        if logged_in:
             session = self.session_manager.get_current_session()
-            # Find the student object
-            for student in self.students:
-                if student.student_id == session.user_id:
-                    self.current_user = student
-                    break
-            messagebox.showinfo("Success", f"Welcome, {session.user_name}!")
+            # The session already holds the authenticated student
+            self.current_user = session.user_obj
             self._create_enrollment_window()
+            self._show_status(f"Welcome, {session.user_name}!")
         else:
             messagebox.showerror("Error", "Invalid email or password.")
     
     def _create_enrollment_window(self):
-        """Create the enrollment window"""
-        # Clear existing widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        """Show the enrollment window for the current user, building it on first use"""
+        self._login_frame.grid_remove()
+        if self._enrollment_frame is None:
+            self._build_enrollment_frame()
+        self._refresh_enrollment_frame()
+        self._enrollment_frame.grid()
+    
+    def _refresh_enrollment_frame(self):
+        """Update the user-specific parts of the enrollment window"""
+        self._welcome_label.configure(text=f"Welcome, {self.current_user.name}!")
+        self._student_id_label.configure(text=self.current_user.student_id)
+        self._email_label.configure(text=self.current_user.email)
+        self._notebook.select(0)
+        self._show_status("")
+        
+        # Rows are keyed by subject_id only, so drop the previous user's rows before repopulating
+        self.enrollments_tree.delete(*self.enrollments_tree.get_children())
+        self._populate_enrollments()
+    
+    def _show_status(self, message: str):
+        """Show a success message in the status bar, clearing it after a few seconds"""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+        self.status_label.configure(text=message)
+        if message:
+            self._status_after_id = self.root.after(self._STATUS_CLEAR_MS, self._show_status, "")
+    
+    def _build_enrollment_frame(self):
+        """Build the enrollment widgets once; later logins only refresh and show the frame"""
         # Main frame
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._enrollment_frame = main_frame
         
         # Configure grid weights
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(2, weight=1)
         
@@ -146,9 +256,8 @@ class GUIUniApp:
         header_frame.columnconfigure(1, weight=1)
         
         # Welcome message
-        welcome_label = ttk.Label(header_frame, text=f"Welcome, {self.current_user.name}!", 
-                                 font=("Arial", 14, "bold"))
-        welcome_label.grid(row=0, column=0, sticky=tk.W)
+        self._welcome_label = ttk.Label(header_frame, font=("Arial", 14, "bold"))
+        self._welcome_label.grid(row=0, column=0, sticky=tk.W)
         
         # Logout button
         ttk.Button(header_frame, text="Logout", command=self._logout).grid(row=0, column=1, sticky=tk.E)
@@ -159,10 +268,12 @@ class GUIUniApp:
         info_frame.columnconfigure(1, weight=1)
         
         ttk.Label(info_frame, text="Student ID:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
-        ttk.Label(info_frame, text=self.current_user.student_id).grid(row=0, column=1, sticky=tk.W)
+        self._student_id_label = ttk.Label(info_frame)
+        self._student_id_label.grid(row=0, column=1, sticky=tk.W)
         
         ttk.Label(info_frame, text="Email:").grid(row=1, column=0, sticky=tk.W, padx=(0, 10))
-        ttk.Label(info_frame, text=self.current_user.email).grid(row=1, column=1, sticky=tk.W)
+        self._email_label = ttk.Label(info_frame)
+        self._email_label.grid(row=1, column=1, sticky=tk.W)
         
         # Main content frame
         content_frame = ttk.Frame(main_frame)
@@ -172,6 +283,7 @@ class GUIUniApp:
         
         # Create notebook for tabs
         notebook = ttk.Notebook(content_frame)
+        self._notebook = notebook
         notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Enroll tab
@@ -183,6 +295,10 @@ class GUIUniApp:
         view_frame = ttk.Frame(notebook, padding="10")
         notebook.add(view_frame, text="View Enrollments")
         self._create_view_tab(view_frame)
+        
+        # Status bar for success feedback; errors still use modal dialogs
+        self.status_label = ttk.Label(main_frame, text="", foreground="green")
+        self.status_label.grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
     
     def _create_enroll_tab(self, parent):
         """Create the enroll tab"""
@@ -261,8 +377,7 @@ class GUIUniApp:
         self.enrollments_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate enrollments
-        self._populate_enrollments()
+        # Rows are filled per user by _refresh_enrollment_frame
         
         # Remove button
         remove_button = ttk.Button(parent, text="Remove Selected Enrollment", 
@@ -271,13 +386,8 @@ class GUIUniApp:
     
     def _populate_subjects(self):
         """Populate the subjects treeview"""
-        # Clear existing items
-        for item in self.subjects_tree.get_children():
-            self.subjects_tree.delete(item)
-        
-        # Add subjects
         for subject in self.subjects:
-            self.subjects_tree.insert("", tk.END, values=(
+            self.subjects_tree.insert("", tk.END, iid=subject.subject_id, values=(
                 subject.subject_id,
                 subject.name,
                 subject.description
@@ -285,40 +395,39 @@ class GUIUniApp:
     
     def _populate_enrollments(self):
         """Populate the enrollments treeview"""
-        # Clear existing items
-        for item in self.enrollments_tree.get_children():
-            self.enrollments_tree.delete(item)
-        
-        # Add enrollments
-        for enrollment in self.current_user.enrollments:
-            subject_name = next((s.name for s in self.subjects if s.subject_id == enrollment.subject_id), "Unknown")
-            self.enrollments_tree.insert("", tk.END, values=(
-                enrollment.subject_id,
-                subject_name,
-                enrollment.mark,
-                enrollment.grade,
-                enrollment.enrollment_date.strftime('%Y-%m-%d')
-            ))
+        for subject_id, enrollment in self.current_user.enrollments.items():
+            self.enrollments_tree.insert("", tk.END, iid=subject_id, values=self._enrollment_values(enrollment))
+    
+    def _enrollment_values(self, enrollment) -> tuple:
+        """Build the enrollments treeview row for one enrollment"""
+        subject = self._subjects_by_id.get(enrollment.subject_id)
+        return (
+            enrollment.subject_id,
+            subject.name if subject else "Unknown",
+            enrollment.mark,
+            enrollment.grade,
+            enrollment.get_display_date()
+        )
     
     def _enroll_subject(self):
         """Handle random subject enrollment"""
-        # Check enrollment limit
+        # Check enrollment limit; enroll_random can only fail on the cap if it was already reached here
         if len(self.current_user.enrollments) >= 4:
             messagebox.showerror("Error", "You have reached the maximum enrollment limit of 4 subjects.")
             return
         
         # Enroll in a random subject
-        enrolled_subject = self.current_user.enroll_random(self.subjects)
+        enrolled_subject = self.current_user.enroll_random(self._subjects_by_id)
         
         if enrolled_subject:
-            self.data_manager.save_data(self.students)
-            messagebox.showinfo("Success", f"Successfully enrolled in {enrolled_subject.name}!")
-            self._populate_enrollments()
+            self._schedule_save(self.current_user)
+            self._show_status(f"Successfully enrolled in {enrolled_subject.name}!")
+            # Only one row changed, so insert just that one
+            subject_id = enrolled_subject.subject_id
+            self.enrollments_tree.insert("", tk.END, iid=subject_id,
+                                         values=self._enrollment_values(self.current_user.enrollments[subject_id]))
         else:
-            if len(self.current_user.enrollments) >= 4:
-                messagebox.showerror("Error", "You have reached the maximum enrollment limit of 4 subjects.")
-            else:
-                messagebox.showerror("Error", "No subjects available for enrollment.")
+            messagebox.showerror("Error", "No subjects available for enrollment.")
     
     def _remove_enrollment(self):
         """Handle enrollment removal"""
@@ -327,17 +436,17 @@ class GUIUniApp:
             messagebox.showwarning("Warning", "Please select an enrollment to remove.")
             return
         
-        # Get selected enrollment
-        item = self.enrollments_tree.item(selection[0])
-        subject_id = str(item['values'][0])
-        subject_name = item['values'][1]
+        # Rows are keyed by subject_id, so the selected iid is the enrollment key
+        subject_id = selection[0]
+        subject = self._subjects_by_id.get(subject_id)
+        subject_name = subject.name if subject else "Unknown"
         
         # Confirm removal
         if messagebox.askyesno("Confirm", f"Are you sure you want to remove {subject_name}?"):
             if self.current_user.remove_subject(subject_id):
-                self.data_manager.save_data(self.students)
-                messagebox.showinfo("Success", f"Successfully removed {subject_name}!")
-                self._populate_enrollments()
+                self._schedule_save(self.current_user)
+                self._show_status(f"Successfully removed {subject_name}!")
+                self.enrollments_tree.delete(subject_id)
             else:
                 messagebox.showerror("Error", "Failed to remove enrollment.")
     
@@ -9,8 +9,7 @@ import os
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from cli_app import CLIUniApp
-from gui_app import GUIUniApp
+# The CLI and GUI apps are imported in their menu branches so CLI users never pay for tkinter
 
 
 def main():
@@ -29,11 +28,13 @@ def main():
             
             if choice == "1":
                 print("\nStarting CLI Application...")
+                from cli_app import CLIUniApp
                 cli_app = CLIUniApp()
                 cli_app.run()
                 break
             elif choice == "2":
                 print("\nStarting GUI Application...")
+                from gui_app import GUIUniApp
                 gui_app = GUIUniApp()
                 gui_app.run()
                 break
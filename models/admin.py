@@ -6,6 +6,8 @@ from .student import Student
 class Admin:
     """Represents a university administrator."""
     
+    __slots__ = ('admin_id', 'name', 'department')
+    
     PREDEFINED_ADMINS = {
         "admin001": {"name": "Dr. Sarah Johnson", "department": "IT Department", "password": "Admin123"},
         "admin002": {"name": "Prof. Michael Chen", "department": "Academic Affairs", "password": "Admin456"},
@@ -17,53 +19,50 @@ class Admin:
         self.name = name
         self.department = department
     
-    def view_students(self, students: List[Student]) -> List[Dict[str, str]]:
+    @staticmethod
+    def view_students(students: List[Student]) -> List[Dict[str, str]]:
         """View all registered students"""
         return [student.get_info() for student in students]
     
-    def view_by_grade(self, students: List[Student]) -> Dict[str, List[Dict[str, str]]]:
+    @staticmethod
+    def view_by_grade(students: List[Student]) -> Dict[str, List[Dict[str, str]]]:
         """Organize and view students by grade"""
         grade_groups: Dict[str, List[Dict[str, str]]] = {'Z': [], 'P': [], 'C': [], 'D': [], 'HD': []}
         for student in students:
-            for enrollment in student.enrollments:
-                grade = enrollment.grade
-                if grade in grade_groups:
-                    grade_groups[grade].append({
-                        'student_id': student.student_id,
-                        'name': student.name,
+            student_id, name = student.student_id, student.name
+            for enrollment in student.enrollments.values():
+                # One probe finds the bucket; unknown grades are skipped as before
+                group = grade_groups.get(enrollment.grade)
+                if group is not None:
+                    group.append({
+                        'student_id': student_id,
+                        'name': name,
                         'subject_id': enrollment.subject_id,
                         'mark': str(enrollment.mark),
-                        'grade': grade
+                        'grade': enrollment.grade
                     })
         return grade_groups
     
-    def categorize_pass_fail(self, students: List[Student]) -> Dict[str, List[Dict[str, str]]]:
+    @staticmethod
+    def categorize_pass_fail(students: List[Student]) -> Dict[str, List[Dict[str, str]]]:
         """Categorize students into PASS/FAIL categories"""
-        pass_students: List[Dict[str, str]] = []
-        fail_students: List[Dict[str, str]] = []
+        categories: Dict[str, List[Dict[str, str]]] = {'PASS': [], 'FAIL': []}
         for student in students:
-            for enrollment in student.enrollments:
-                if enrollment.mark >= 50:
-                    pass_students.append({
-                        'student_id': student.student_id,
-                        'name': student.name,
-                        'subject_id': enrollment.subject_id,
-                        'mark': str(enrollment.mark),
-                        'grade': enrollment.grade,
-                        'status': 'PASS'
-                    })
-                else:
-                    fail_students.append({
-                        'student_id': student.student_id,
-                        'name': student.name,
-                        'subject_id': enrollment.subject_id,
-                        'mark': str(enrollment.mark),
-                        'grade': enrollment.grade,
-                        'status': 'FAIL'
-                    })
-        return {'PASS': pass_students, 'FAIL': fail_students}
+            student_id, name = student.student_id, student.name
+            for enrollment in student.enrollments.values():
+                status = 'PASS' if enrollment.mark >= 50 else 'FAIL'
+                categories[status].append({
+                    'student_id': student_id,
+                    'name': name,
+                    'subject_id': enrollment.subject_id,
+                    'mark': str(enrollment.mark),
+                    'grade': enrollment.grade,
+                    'status': status
+                })
+        return categories
     
-    def remove_student(self, student_id: str, students: List[Student]) -> bool:
+    @staticmethod
+    def remove_student(student_id: str, students: List[Student]) -> bool:
         """Remove individual student"""
         for i, student in enumerate(students):
             if student.student_id == student_id:
@@ -71,7 +70,8 @@ class Admin:
                 return True
         return False
     
-    def clear_all(self, students: List[Student]) -> bool:
+    @staticmethod
+    def clear_all(students: List[Student]) -> bool:
         """Clear entire students list"""
         students.clear()
         return True
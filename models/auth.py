@@ -1,57 +1,108 @@
 import hashlib
+import heapq
+import hmac
 import secrets
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 from .enum.roles import UserRole
 from .session import Session
 
+_sha256 = hashlib.sha256
+_SALT_BYTES = 16
+_SALT_HEX_LEN = _SALT_BYTES * 2
+# scrypt cost parameters (~16 MiB, tens of ms per hash); new hashes are stored as "scrypt$<salt>:<key>"
+_SCRYPT_PREFIX = "scrypt$"
+_SCRYPT_N, _SCRYPT_R, _SCRYPT_P, _SCRYPT_DKLEN = 16384, 8, 1, 32
+
+
+def _scrypt(password: str, salt: bytes) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P, dklen=_SCRYPT_DKLEN)
+
+
+# Verified against when an email is unknown, so failed lookups still cost one hash
+_DUMMY_HASH = f"{_SCRYPT_PREFIX}{secrets.token_hex(_SALT_BYTES)}:{secrets.token_hex(_SCRYPT_DKLEN)}"
+# Salt for the scrypt run on legacy hashes, so they cost as much as the dummy check
+_LEGACY_PAD_SALT = secrets.token_bytes(_SALT_BYTES)
+# Compared against when an admin ID is unknown
+_DUMMY_ADMIN_PASSWORD = secrets.token_bytes(_SALT_BYTES)
+
 
 class AuthenticationService:
     """Service class for handling authentication and session management"""
     
     def __init__(self):
         self.active_sessions: Dict[str, Session] = {}
+        # (expires_at, session_id) min-heap so cleanup only visits sessions that may have expired
+        self._expiry_heap: List[Tuple[datetime, str]] = []
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash password using SHA-256 with salt"""
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return f"{salt}:{password_hash}"
+        """Hash password using scrypt with a random salt"""
+        salt = secrets.token_bytes(_SALT_BYTES)
+        return f"{_SCRYPT_PREFIX}{salt.hex()}:{_scrypt(password, salt).hex()}"
     
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
-        """Verify password against hash"""
-        try:
-            salt, password_hash = hashed_password.split(':')
-            return hashlib.sha256((password + salt).encode()).hexdigest() == password_hash
-        except ValueError:
+        """Verify password against hash; legacy salted SHA-256 hashes are still accepted"""
+        is_scrypt = hashed_password.startswith(_SCRYPT_PREFIX)
+        if is_scrypt:
+            hashed_password = hashed_password[len(_SCRYPT_PREFIX):]
+        # Stored as "<salt>:<digest>" with a fixed-width salt, so slice instead of splitting
+        if hashed_password[_SALT_HEX_LEN:_SALT_HEX_LEN + 1] != ':':
             return False
+        salt = hashed_password[:_SALT_HEX_LEN]
+        password_hash = hashed_password[_SALT_HEX_LEN + 1:]
+        if is_scrypt:
+            try:
+                computed = _scrypt(password, bytes.fromhex(salt)).hex()
+            except ValueError:
+                return False
+        else:
+            computed = _sha256((password + salt).encode()).hexdigest()
+            # Legacy accounts would otherwise answer far faster than unknown emails checked against _DUMMY_HASH
+            _scrypt(password, _LEGACY_PAD_SALT)
+        return hmac.compare_digest(computed.encode(), password_hash.encode())
     
-    def authenticate_student(self, email: str, password: str, students: List['Student']) -> Optional[Session]:
-        """Authenticate student and create session"""
-        for student in students:
-            if student.email == email and self.verify_password(password, student.password_hash):
-                session = Session(student.student_id, UserRole.STUDENT, student.name)
-                self.active_sessions[session.session_id] = session
-                return session
+    def authenticate_student(self, email: str, password: str,
+                             students: Union[List['Student'], Mapping[str, 'Student']]) -> Optional[Session]:
+        """Authenticate student and create session; pass an email-keyed mapping for an O(1) lookup"""
+        if isinstance(students, Mapping):
+            student = students.get(email)
+        else:
+            student = next((s for s in students if s.email == email), None)
+        # Hash once either way so unknown emails take as long as wrong passwords
+        password_hash = student.password_hash if student else _DUMMY_HASH
+        if self.verify_password(password, password_hash) and student:
+            session = Session(student.student_id, UserRole.STUDENT, student.name, student)
+            self._add_session(session)
+            return session
         return None
     
     def authenticate_admin(self, admin_id: str, password: str, predefined_admins: Dict[str, Dict[str, str]]) -> Optional[Session]:
         """Authenticate admin and create session"""
-        if admin_id in predefined_admins:
-            admin_info = predefined_admins[admin_id]
-            if admin_info["password"] == password:
-                session = Session(admin_id, UserRole.ADMIN, admin_info["name"])
-                self.active_sessions[session.session_id] = session
-                return session
+        admin_info = predefined_admins.get(admin_id)
+        # Compare against a dummy on unknown IDs too, so valid admin IDs can't be told apart by timing.
+        # Encode first since compare_digest rejects non-ASCII str
+        expected = admin_info["password"].encode() if admin_info else _DUMMY_ADMIN_PASSWORD
+        if hmac.compare_digest(expected, password.encode()) and admin_info:
+            session = Session(admin_id, UserRole.ADMIN, admin_info["name"])
+            self._add_session(session)
+            return session
         return None
     
+    def _add_session(self, session: Session):
+        """Track a new session and queue its expiry for cleanup"""
+        # Expired sessions are reaped on each login, so neither the dict nor the heap outlives the TTL
+        self.cleanup_expired_sessions()
+        self.active_sessions[session.session_id] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.session_id))
+    
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get session by ID"""
         session = self.active_sessions.get(session_id)
-        if session and session.is_valid():
-            session.refresh()
+        # refresh() checks validity and extends the expiry with a single clock read
+        if session and session.refresh():
             return session
         elif session:
             del self.active_sessions[session_id]
@@ -62,17 +113,22 @@ class AuthenticationService:
         session = self.active_sessions.get(session_id)
         if session:
             session.invalidate()
+            session.user_obj = None
             del self.active_sessions[session_id]
             return True
         return False
     
     def cleanup_expired_sessions(self):
         """Remove expired sessions"""
-        expired_sessions = [
-            sid for sid, session in self.active_sessions.items()
-            if not session.is_valid()
-        ]
-        for sid in expired_sessions:
-            del self.active_sessions[sid]
-
-
+        heap = self._expiry_heap
+        now = datetime.now()
+        while heap and heap[0][0] <= now:
+            _, sid = heapq.heappop(heap)
+            session = self.active_sessions.get(sid)
+            if session is None:
+                continue
+            if session.is_valid():
+                # Refreshed since it was queued; requeue at its new expiry
+                heapq.heappush(heap, (session.expires_at, sid))
+            else:
+                del self.active_sessions[sid]
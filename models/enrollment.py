@@ -4,22 +4,50 @@ from typing import Dict, Optional
 
 from .grading import GradingService
 
+# Grading rules are fixed, so every enrollment shares one service instead of building its own
+_grading_service = GradingService()
+
 
 class Enrollment:
     """Represents a student's enrollment in a subject."""
     
-    def __init__(self, student_id: str, subject_id: str, mark: Optional[int] = None, grade: Optional[str] = None):
+    __slots__ = ('student_id', 'subject_id', 'mark', 'grade', 'enrollment_date', '_iso_date', '_display_date',
+                 '_timestamp')
+    
+    def __init__(self, student_id: str, subject_id: str, mark: Optional[int] = None, grade: Optional[str] = None,
+                 enrollment_date: Optional[datetime] = None):
         self.student_id = student_id
         self.subject_id = subject_id
-        self.mark = mark or random.randint(25, 100)
-        self.grade = grade or GradingService().calculate_grade(self.mark)
-        self.enrollment_date = datetime.now()
+        self.mark = mark or random.randrange(25, 101)
+        self.grade = grade or _grading_service.calculate_grade(self.mark)
+        self.enrollment_date = enrollment_date or datetime.now()
+        self._iso_date: Optional[str] = None
+        self._display_date: Optional[str] = None
+        self._timestamp: Optional[str] = None
     
     def calculate_grade(self) -> str:
         """Calculate grade based on current mark"""
-        self.grade = GradingService().calculate_grade(self.mark)
+        self.grade = _grading_service.calculate_grade(self.mark)
         return self.grade
     
+    def get_iso_date(self) -> str:
+        """Return the enrollment date in ISO format, formatted once and cached"""
+        if self._iso_date is None:
+            self._iso_date = self.enrollment_date.isoformat()
+        return self._iso_date
+    
+    def get_display_date(self) -> str:
+        """Return the enrollment date as YYYY-MM-DD, formatted once and cached"""
+        if self._display_date is None:
+            self._display_date = self.enrollment_date.strftime('%Y-%m-%d')
+        return self._display_date
+    
+    def get_timestamp(self) -> str:
+        """Return the enrollment date as YYYY-MM-DD HH:MM:SS, formatted once and cached"""
+        if self._timestamp is None:
+            self._timestamp = self.enrollment_date.strftime('%Y-%m-%d %H:%M:%S')
+        return self._timestamp
+    
     def get_info(self) -> Dict[str, str]:
         """Return enrollment details"""
         return {
@@ -27,7 +55,7 @@ class Enrollment:
             'subject_id': self.subject_id,
             'mark': str(self.mark),
             'grade': self.grade,
-            'enrollment_date': self.enrollment_date.strftime('%Y-%m-%d %H:%M:%S')
+            'enrollment_date': self.get_timestamp()
         }
 
 
@@ -1,30 +1,38 @@
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 
 from .enum.roles import UserRole
 
+_SESSION_TTL = timedelta(hours=24)
+
 
 class Session:
     """Represents a user session with token-based authentication"""
     
-    def __init__(self, user_id: str, user_role: UserRole, user_name: str):
+    __slots__ = ('session_id', 'user_id', 'user_role', 'user_name', 'user_obj', 'created_at', 'expires_at', 'is_active')
+    
+    def __init__(self, user_id: str, user_role: UserRole, user_name: str, user_obj: Any = None):
         self.session_id = secrets.token_urlsafe(32)
         self.user_id = user_id
         self.user_role = user_role
         self.user_name = user_name
+        self.user_obj = user_obj
         self.created_at = datetime.now()
-        self.expires_at = datetime.now() + timedelta(hours=24)
+        self.expires_at = self.created_at + _SESSION_TTL
         self.is_active = True
     
     def is_valid(self) -> bool:
         """Check if session is still valid"""
         return self.is_active and datetime.now() < self.expires_at
     
-    def refresh(self):
-        """Refresh session expiry time"""
-        if self.is_valid():
-            self.expires_at = datetime.now() + timedelta(hours=24)
+    def refresh(self) -> bool:
+        """Refresh session expiry time; returns whether the session was still valid"""
+        now = datetime.now()
+        if not (self.is_active and now < self.expires_at):
+            return False
+        self.expires_at = now + _SESSION_TTL
+        return True
     
     def invalidate(self):
         """Invalidate the session"""
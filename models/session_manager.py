@@ -1,26 +1,31 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
+from .admin import Admin
 from .auth import AuthenticationService
 from .enum.roles import UserRole
 from .session import Session
 
+# Process-wide, like the SessionManager singleton that uses it
+_auth_service = AuthenticationService()
+
 
 class SessionManager:
     """Singleton class for managing global session state"""
     
+    __slots__ = ('_current_session',)
+    
     _instance = None
-    _auth_service = None
-    _current_session = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._auth_service = AuthenticationService()
+            cls._instance._current_session = None
         return cls._instance
     
-    def login_student(self, email: str, password: str, students: List['Student']) -> bool:
-        """Login student and set current session"""
-        session = self._auth_service.authenticate_student(email, password, students)
+    def login_student(self, email: str, password: str,
+                      students: Union[List['Student'], Mapping[str, 'Student']]) -> bool:
+        """Login student and set current session; students may be an email-keyed mapping"""
+        session = _auth_service.authenticate_student(email, password, students)
         if session:
             self._current_session = session
             return True
@@ -28,8 +33,10 @@ class SessionManager:
     
     def login_admin(self, admin_id: str, password: str, predefined_admins: Dict[str, Dict[str, str]]) -> bool:
         """Login admin and set current session"""
-        session = self._auth_service.authenticate_admin(admin_id, password, predefined_admins)
+        session = _auth_service.authenticate_admin(admin_id, password, predefined_admins)
         if session:
+            admin_info = predefined_admins[admin_id]
+            session.user_obj = Admin(admin_id, admin_info["name"], admin_info["department"])
             self._current_session = session
             return True
         return False
@@ -37,23 +44,29 @@ class SessionManager:
     def logout(self) -> bool:
         """Logout current user"""
         if self._current_session:
-            success = self._auth_service.logout(self._current_session.session_id)
+            success = _auth_service.logout(self._current_session.session_id)
             self._current_session = None
             return success
         return False
     
     def get_current_session(self) -> Optional[Session]:
         """Get current active session"""
-        if self._current_session and self._current_session.is_valid():
-            return self._current_session
-        elif self._current_session:
+        session = self._current_session
+        if session is None or not session.is_valid():
+            # Drop an expired session so later reads stop at the None check
             self._current_session = None
-        return None
+            return None
+        return session
     
     def is_logged_in(self) -> bool:
         """Check if someone is currently logged in"""
         return self.get_current_session() is not None
     
+    def get_current_user(self) -> Any:
+        """Get the Student or Admin object resolved at login"""
+        session = self.get_current_session()
+        return session.user_obj if session else None
+    
     def get_current_user_id(self) -> Optional[str]:
         """Get current user ID"""
         session = self.get_current_session()
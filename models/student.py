@@ -1,20 +1,28 @@
-from typing import Dict, List, Optional
+import random
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 from .auth import AuthenticationService
 from .enrollment import Enrollment
 from .subject import Subject
 from .validation import ValidationService
 
+_choice = random.choice
+# Rejection draws tried on a subject sequence before filtering it in full
+_MAX_BLIND_DRAWS = 8
+
 
 class Student:
     """Represents a university student."""
     
+    __slots__ = ('student_id', 'name', 'email', 'password_hash', 'enrollments')
+    
     def __init__(self, student_id: str, name: str, email: str, password_hash: str):
         self.student_id = student_id
         self.name = name
         self.email = email
         self.password_hash = password_hash
-        self.enrollments: List[Enrollment] = []
+        # Keyed by subject_id; dicts keep insertion order, so enrollments still list in enrolment order
+        self.enrollments: Dict[str, Enrollment] = {}
     
     @classmethod
     def create_student(cls, student_id: str, name: str, email: str, password: str) -> 'Student':
@@ -24,43 +32,47 @@ class Student:
     
     def enroll(self, subject: Subject) -> bool:
         """Enroll in a subject (maximum 4 subjects)"""
-        if len(self.enrollments) >= 4:
+        if len(self.enrollments) >= 4 or subject.subject_id in self.enrollments:
             return False
-        for enrollment in self.enrollments:
-            if enrollment.subject_id == subject.subject_id:
-                return False
-        enrollment = Enrollment(self.student_id, subject.subject_id)
-        self.enrollments.append(enrollment)
+        self.enrollments[subject.subject_id] = Enrollment(self.student_id, subject.subject_id)
         return True
     
-    def enroll_random(self, available_subjects: List[Subject]) -> Optional[Subject]:
-        """Enroll in a random subject from available subjects"""
+    def enroll_random(self, available_subjects: Union[Iterable[Subject], Mapping[str, Subject]]) -> Optional[Subject]:
+        """Enroll in a random subject; a subject_id-keyed catalog is filtered with a set difference"""
         if len(self.enrollments) >= 4:
             return None
-        eligible_subjects: List[Subject] = []
-        enrolled_subject_ids = {enrollment.subject_id for enrollment in self.enrollments}
-        for subject in available_subjects:
-            if subject.subject_id not in enrolled_subject_ids:
-                eligible_subjects.append(subject)
-        if not eligible_subjects:
-            return None
-        import random
-        selected_subject = random.choice(eligible_subjects)
+        if isinstance(available_subjects, Mapping):
+            eligible_ids = tuple(available_subjects.keys() - self.enrollments.keys())
+            if not eligible_ids:
+                return None
+            selected_subject = available_subjects[_choice(eligible_ids)]
+        else:
+            selected_subject = None
+            if isinstance(available_subjects, Sequence):
+                if not available_subjects:
+                    return None
+                # At most four subjects are taken, so a few uniform draws almost always hit a free one
+                for _ in range(min(len(available_subjects), _MAX_BLIND_DRAWS)):
+                    candidate = _choice(available_subjects)
+                    if candidate.subject_id not in self.enrollments:
+                        selected_subject = candidate
+                        break
+            if selected_subject is None:
+                eligible_subjects = [s for s in available_subjects if s.subject_id not in self.enrollments]
+                if not eligible_subjects:
+                    return None
+                selected_subject = _choice(eligible_subjects)
         if self.enroll(selected_subject):
             return selected_subject
         return None
     
     def remove_subject(self, subject_id: str) -> bool:
         """Remove a subject from enrollment list"""
-        for i, enrollment in enumerate(self.enrollments):
-            if enrollment.subject_id == subject_id:
-                del self.enrollments[i]
-                return True
-        return False
+        return self.enrollments.pop(subject_id, None) is not None
     
     def view_enrollments(self) -> List[Dict[str, str]]:
         """View current enrollment list"""
-        return [enrollment.get_info() for enrollment in self.enrollments]
+        return [enrollment.get_info() for enrollment in self.enrollments.values()]
     
     def change_password(self, old_password: str, new_password: str, validation_service: ValidationService) -> bool:
         """Change student password with validation"""
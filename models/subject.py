@@ -5,6 +5,8 @@ from typing import Dict
 class Subject:
     """Represents a university subject/course."""
     
+    __slots__ = ('subject_id', 'name', 'description', 'credits')
+    
     def __init__(self, subject_id: str, name: str, description: str = "", credits: int = 3):
         self.subject_id = subject_id
         self.name = name
@@ -14,7 +16,7 @@ class Subject:
     @classmethod
     def create(cls, name: str, description: str = "", credits: int = 3) -> 'Subject':
         """Create a new subject"""
-        subject_id = str(random.randint(1, 999)).zfill(3)
+        subject_id = f"{random.randrange(1, 1000):03d}"
         return cls(subject_id, name, description, credits)
     
     def get_info(self) -> Dict[str, str]:
@@ -1,40 +1,65 @@
 import re
 import random
-from typing import Dict, List
+from functools import lru_cache
+from typing import Collection, Dict, List, Mapping, Union
+
+
+_EMAIL_SUFFIX = "@university.com"
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@university\.com$')
+_PASSWORD_RE = re.compile(r'^[A-Z][a-zA-Z]{4,}\d{3,}$')
+
+
+@lru_cache(maxsize=1024)
+def _valid_email(email: str) -> bool:
+    """Memoized email format check shared by every ValidationService"""
+    # Cheap suffix test rejects most bad input before running the regex
+    return email.endswith(_EMAIL_SUFFIX) and _EMAIL_RE.match(email) is not None
 
 
 class ValidationService:
     """Service class for validating email and password formats."""
     
     def __init__(self):
-        self.email_pattern = r'^[a-zA-Z0-9._%+-]+@university\.com$'
-        self.password_pattern = r'^[A-Z][a-zA-Z]{4,}\d{3,}$'
+        self.email_pattern = _EMAIL_RE
+        self.password_pattern = _PASSWORD_RE
     
     def validate_email(self, email: str) -> bool:
         """Validate email format - must end with @university.com"""
-        return bool(re.match(self.email_pattern, email))
+        return _valid_email(email)
     
     def validate_password(self, password: str) -> bool:
         """Validate password format - starts with uppercase, 5+ letters, 3+ digits"""
-        return bool(re.match(self.password_pattern, password))
+        # Not memoized: a cache would keep plaintext passwords alive in memory
+        return self.password_pattern.match(password) is not None
+    
+    def validate_credentials(self, email: str, password: str) -> bool:
+        """Validate email and password formats together"""
+        return self.validate_email(email) and self.validate_password(password)
     
-    def validate_student_registration(self, name: str, email: str, password: str, existing_students: List['Student']) -> Dict[str, str]:
-        """Centralized validation for student registration"""
+    def validate_student_registration(self, name: str, email: str, password: str,
+                                      existing_students: Union[List['Student'], Mapping[str, 'Student']]) -> Dict[str, str]:
+        """Centralized validation for student registration; pass an email-keyed mapping for an O(1) duplicate check"""
         if not name or not email or not password:
             return {'valid': False, 'error': 'All fields are required!'}
         if not self.validate_email(email):
             return {'valid': False, 'error': 'Invalid email format. Must end with @university.com'}
         if not self.validate_password(password):
             return {'valid': False, 'error': 'Invalid password format. Must start with uppercase, have 5+ letters, and 3+ digits.'}
-        for student in existing_students:
-            if student.email == email:
-                return {'valid': False, 'error': 'Email already registered.'}
+        if isinstance(existing_students, Mapping):
+            registered = email in existing_students
+        else:
+            registered = any(student.email == email for student in existing_students)
+        if registered:
+            return {'valid': False, 'error': 'Email already registered.'}
         return {'valid': True, 'error': ''}
     
-    def generate_student_id(self, existing_ids: List[str]) -> str:
-        """Generate unique 6-digit student ID"""
+    def generate_student_id(self, existing_ids: Collection[str]) -> str:
+        """Generate unique 6-digit student ID; existing_ids may be a set or dict view for O(1) checks"""
+        # A list would cost O(N) per retry; one conversion keeps every retry O(1)
+        if isinstance(existing_ids, (list, tuple)):
+            existing_ids = set(existing_ids)
         while True:
-            student_id = str(random.randint(1, 999999)).zfill(6)
+            student_id = f"{random.randrange(1, 1000000):06d}"
             if student_id not in existing_ids:
                 return student_id
 
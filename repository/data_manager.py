@@ -5,6 +5,8 @@ Handles file operations for students.data persistence.
 
 import json
 import os
+import sys
+from datetime import datetime
 from typing import List, Dict, Optional
 from models.student import Student
 from models.enrollment import Enrollment
@@ -16,43 +18,103 @@ class DataManager:
     def __init__(self, file_path: str = "students.data"):
         self.file_path = file_path
         self.data: Dict = {}
+        # Serialized JSON record per student_id, reused until that student changes
+        self._records: Dict[str, str] = {}
+        self._pending = False
     
-    def save_data(self, students: List[Student]) -> bool:
-        """Save student data to students.data file"""
+    @staticmethod
+    def _serialize_student(student: Student) -> str:
+        """Serialize one student as a single-line element of the top-level JSON array"""
+        student_data = {
+            'student_id': student.student_id,
+            'name': student.name,
+            'email': student.email,
+            'password_hash': student.password_hash,
+            'enrollments': []
+        }
+        
+        # Convert enrollments
+        for enrollment in student.enrollments.values():
+            enrollment_data = {
+                'student_id': enrollment.student_id,
+                'subject_id': enrollment.subject_id,
+                'mark': enrollment.mark,
+                'grade': enrollment.grade,
+                'enrollment_date': enrollment.get_iso_date()
+            }
+            student_data['enrollments'].append(enrollment_data)
+        
+        # Without indent json uses its C encoder; one record per line keeps the file readable
+        return "  " + json.dumps(student_data, separators=(',', ':'))
+    
+    def _take_payload(self, students: List[Student]) -> Optional[str]:
+        """Assemble the file contents from cached records, serializing any that are missing"""
         try:
-            # Convert students to serializable format
-            students_data = []
+            records = {}
             for student in students:
-                student_data = {
-                    'student_id': student.student_id,
-                    'name': student.name,
-                    'email': student.email,
-                    'password_hash': student.password_hash,
-                    'enrollments': []
-                }
-                
-                # Convert enrollments
-                for enrollment in student.enrollments:
-                    enrollment_data = {
-                        'student_id': enrollment.student_id,
-                        'subject_id': enrollment.subject_id,
-                        'mark': enrollment.mark,
-                        'grade': enrollment.grade,
-                        'enrollment_date': enrollment.enrollment_date.isoformat()
-                    }
-                    student_data['enrollments'].append(enrollment_data)
-                
-                students_data.append(student_data)
-            
-            # Save to file
-            with open(self.file_path, 'w') as file:
-                json.dump(students_data, file, indent=2)
-            
+                record = self._records.get(student.student_id)
+                if record is None:
+                    record = self._serialize_student(student)
+                records[student.student_id] = record
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return None
+        self._records = records
+        self._pending = False
+        return "[\n" + ",\n".join(records.values()) + "\n]" if records else "[]"
+    
+    def write_payload(self, payload: str) -> bool:
+        """Write prepared file contents; touches no model objects, so it may run on a worker thread"""
+        try:
+            # Write to a temp file and swap it in so a crash never leaves a partial file
+            tmp_path = f"{self.file_path}.tmp"
+            # Encode once and write raw bytes, skipping the text-layer wrapper
+            with open(tmp_path, 'wb') as file:
+                file.write(payload.encode('utf-8'))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.file_path)
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
+            # Keep the changes pending so the next flush retries them
+            self._pending = True
             return False
     
+    def _write_records(self, students: List[Student]) -> bool:
+        """Write the cached records for students, serializing any that are missing"""
+        payload = self._take_payload(students)
+        return payload is not None and self.write_payload(payload)
+    
+    def take_pending(self, students: List[Student]) -> Optional[str]:
+        """Build the payload for staged changes and mark them taken; None when nothing is staged"""
+        return self._take_payload(students) if self._pending else None
+    
+    def save_data(self, students: List[Student]) -> bool:
+        """Save student data to students.data file"""
+        self._records.clear()
+        return self._write_records(students)
+    
+    def save_changes(self, students: List[Student]) -> bool:
+        """Save student data, serializing only students without a cached record"""
+        return self._write_records(students)
+    
+    def stage_student(self, student: Student):
+        """Re-serialize a changed student; written by the next flush_pending"""
+        self._records[student.student_id] = self._serialize_student(student)
+        self._pending = True
+    
+    def forget_student(self, student_id: str):
+        """Drop a removed student's record; written by the next flush_pending"""
+        self._records.pop(student_id, None)
+        self._pending = True
+    
+    def flush_pending(self, students: List[Student]) -> bool:
+        """Write staged changes, reusing the cached records of unchanged students"""
+        if not self._pending:
+            return True
+        return self._write_records(students)
+    
     def load_data(self) -> List[Student]:
         """Load student data from students.data file"""
         students = []
@@ -78,16 +140,15 @@ class DataManager:
                 
                 # Convert enrollments back
                 for enrollment_data in student_data['enrollments']:
+                    # Intern the small, highly repeated keys used for dict/set lookups
                     enrollment = Enrollment(
                         enrollment_data['student_id'],
-                        enrollment_data['subject_id'],
+                        sys.intern(enrollment_data['subject_id']),
                         enrollment_data['mark'],
-                        enrollment_data['grade']
+                        sys.intern(enrollment_data['grade']),
+                        datetime.fromisoformat(enrollment_data['enrollment_date'])
                     )
-                    # Restore enrollment date
-                    from datetime import datetime
-                    enrollment.enrollment_date = datetime.fromisoformat(enrollment_data['enrollment_date'])
-                    student.enrollments.append(enrollment)
+                    student.enrollments[enrollment.subject_id] = enrollment
                 
                 students.append(student)
             
@@ -110,6 +171,8 @@ class DataManager:
         try:
             with open(self.file_path, 'w') as file:
                 json.dump([], file)
+            self._records.clear()
+            self._pending = False
             return True
         except Exception as e:
             print(f"Error clearing data: {e}")
@@ -131,8 +194,15 @@ class DataManager:
     
     def get_student_count(self) -> int:
         """Get total number of students in data file"""
-        students = self.load_data()
-        return len(students)
+        try:
+            if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+                return 0
+            # Count the raw records; no need to build Student/Enrollment objects or parse dates
+            with open(self.file_path, 'r') as file:
+                return len(json.load(file))
+        except Exception as e:
+            print(f"Error counting students: {e}")
+            return 0
     
     def backup_data(self, backup_path: str = None) -> bool:
         """Create backup of current data"""